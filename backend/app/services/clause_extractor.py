@@ -19,6 +19,50 @@ from ..models.clause import (
 )
 from .clause_storage import ClauseStorageService
 
+# Enhanced legal concept keywords with more comprehensive matching
+_CONCEPT_KEYWORDS = {
+    'termination': ['terminat', 'dismiss', 'end', 'expir', 'cease', 'conclude'],
+    'liability': ['liabil', 'damag', 'loss', 'harm', 'responsible', 'accountable'],
+    'confidentiality': ['confidential', 'secret', 'disclos', 'proprietary', 'private', 'non-disclosure'],
+    'employment': ['employ', 'work', 'job', 'position', 'staff', 'personnel'],
+    'contract': ['contract', 'agreement', 'deal', 'arrangement', 'understanding'],
+    'payment': ['pay', 'salary', 'wage', 'compensation', 'remuneration', 'fee', 'cost'],
+    'notice': ['notice', 'notification', 'inform', 'advise', 'communicate'],
+    'breach': ['breach', 'violat', 'default', 'fail', 'non-compliance'],
+    'intellectual_property': ['intellectual property', 'copyright', 'patent', 'trademark', 'ip rights'],
+    'non_compete': ['non-compete', 'non compete', 'restraint', 'covenant', 'restriction'],
+    'discrimination': ['discriminat', 'equal', 'harassment', 'bias', 'prejudice'],
+    'health_safety': ['health', 'safety', 'welfare', 'wellbeing', 'security'],
+    'data_protection': ['data protection', 'privacy', 'gdpr', 'personal data', 'information'],
+    'dispute_resolution': ['dispute', 'arbitration', 'mediation', 'court', 'litigation', 'resolution'],
+    'insurance': ['insurance', 'insure', 'cover', 'policy', 'claim', 'premium'],
+    'indemnity': ['indemnity', 'indemnif', 'compensat', 'reimburse', 'protect'],
+    'force_majeure': ['force majeure', 'act of god', 'unforeseeable', 'beyond control'],
+    'governing_law': ['governing law', 'jurisdiction', 'applicable law', 'legal system'],
+    'entire_agreement': ['entire agreement', 'whole agreement', 'complete agreement', 'supersede'],
+    'amendment': ['amendment', 'modify', 'change', 'alter', 'update', 'revise'],
+    'assignment': ['assignment', 'transfer', 'delegate', 'assign'],
+    'severability': ['severability', 'severable', 'invalid', 'unenforceable'],
+    'waiver': ['waiver', 'waive', 'relinquish', 'abandon', 'give up'],
+    'performance': ['performance', 'perform', 'execute', 'fulfill', 'carry out'],
+    'standards': ['standard', 'quality', 'specification', 'requirement', 'criteria'],
+    'review': ['review', 'assess', 'evaluate', 'examine', 'inspect'],
+    'approval': ['approval', 'approve', 'consent', 'authorize', 'permit'],
+    'escalation': ['escalat', 'refer', 'elevate', 'raise', 'report'],
+    'investigation': ['investigat', 'inquir', 'examine', 'research', 'study'],
+    'evidence': ['evidence', 'proof', 'documentation', 'record', 'witness'],
+    'precedent': ['precedent', 'case law', 'judicial', 'court decision'],
+    'regulation': ['regulation', 'rule', 'law', 'statute', 'requirement'],
+    'compliance': ['compliance', 'comply', 'conform', 'adhere', 'follow'],
+    'audit': ['audit', 'inspection', 'examination', 'check', 'verification']
+}
+
+# One precompiled alternation per concept so each text is scanned once per concept
+_CONCEPT_PATTERNS = {
+    concept: re.compile("|".join(re.escape(keyword) for keyword in keywords))
+    for concept, keywords in _CONCEPT_KEYWORDS.items()
+}
+
 
 class ClauseExtractor:
     """Service for extracting clauses from legal documents."""
@@ -356,52 +400,8 @@ class ClauseExtractor:
     
     def _identify_legal_concepts(self, text: str) -> List[str]:
         """Identify legal concepts in text using keyword matching."""
-        concepts = []
         text_lower = text.lower()
-        
-        # Enhanced legal concept keywords with more comprehensive matching
-        concept_keywords = {
-            'termination': ['terminat', 'dismiss', 'end', 'expir', 'cease', 'conclude'],
-            'liability': ['liabil', 'damag', 'loss', 'harm', 'responsible', 'accountable'],
-            'confidentiality': ['confidential', 'secret', 'disclos', 'proprietary', 'private', 'non-disclosure'],
-            'employment': ['employ', 'work', 'job', 'position', 'staff', 'personnel'],
-            'contract': ['contract', 'agreement', 'deal', 'arrangement', 'understanding'],
-            'payment': ['pay', 'salary', 'wage', 'compensation', 'remuneration', 'fee', 'cost'],
-            'notice': ['notice', 'notification', 'inform', 'advise', 'communicate'],
-            'breach': ['breach', 'violat', 'default', 'fail', 'non-compliance'],
-            'intellectual_property': ['intellectual property', 'copyright', 'patent', 'trademark', 'ip rights'],
-            'non_compete': ['non-compete', 'non compete', 'restraint', 'covenant', 'restriction'],
-            'discrimination': ['discriminat', 'equal', 'harassment', 'bias', 'prejudice'],
-            'health_safety': ['health', 'safety', 'welfare', 'wellbeing', 'security'],
-            'data_protection': ['data protection', 'privacy', 'gdpr', 'personal data', 'information'],
-            'dispute_resolution': ['dispute', 'arbitration', 'mediation', 'court', 'litigation', 'resolution'],
-            'insurance': ['insurance', 'insure', 'cover', 'policy', 'claim', 'premium'],
-            'indemnity': ['indemnity', 'indemnif', 'compensat', 'reimburse', 'protect'],
-            'force_majeure': ['force majeure', 'act of god', 'unforeseeable', 'beyond control'],
-            'governing_law': ['governing law', 'jurisdiction', 'applicable law', 'legal system'],
-            'entire_agreement': ['entire agreement', 'whole agreement', 'complete agreement', 'supersede'],
-            'amendment': ['amendment', 'modify', 'change', 'alter', 'update', 'revise'],
-            'assignment': ['assignment', 'transfer', 'delegate', 'assign'],
-            'severability': ['severability', 'severable', 'invalid', 'unenforceable'],
-            'waiver': ['waiver', 'waive', 'relinquish', 'abandon', 'give up'],
-            'performance': ['performance', 'perform', 'execute', 'fulfill', 'carry out'],
-            'standards': ['standard', 'quality', 'specification', 'requirement', 'criteria'],
-            'review': ['review', 'assess', 'evaluate', 'examine', 'inspect'],
-            'approval': ['approval', 'approve', 'consent', 'authorize', 'permit'],
-            'escalation': ['escalat', 'refer', 'elevate', 'raise', 'report'],
-            'investigation': ['investigat', 'inquir', 'examine', 'research', 'study'],
-            'evidence': ['evidence', 'proof', 'documentation', 'record', 'witness'],
-            'precedent': ['precedent', 'case law', 'judicial', 'court decision'],
-            'regulation': ['regulation', 'rule', 'law', 'statute', 'requirement'],
-            'compliance': ['compliance', 'comply', 'conform', 'adhere', 'follow'],
-            'audit': ['audit', 'inspection', 'examination', 'check', 'verification']
-        }
-        
-        for concept, keywords in concept_keywords.items():
-            if any(keyword in text_lower for keyword in keywords):
-                concepts.append(concept)
-        
-        return concepts
+        return [concept for concept, pattern in _CONCEPT_PATTERNS.items() if pattern.search(text_lower)]
     
     def _save_clauses_to_files(self, clauses: List[ExtractedClause]) -> None:
         """Save extracted clauses to individual JSON files."""
@@ -10,12 +10,22 @@ This service handles document-related operations including:
 
 import json
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import BinaryIO, Dict, List, Any, Optional
 
 
 class DocumentsService:
     """Service for document management operations."""
     
+    @staticmethod
+    def _exists(path: Path) -> bool:
+        """Check whether a data file exists."""
+        return path.exists()
+    
+    @staticmethod
+    def _open_index(path: Path) -> BinaryIO:
+        """Open the case documents index for binary reading."""
+        return open(path, 'rb')
+    
     @staticmethod
     def load_case_documents(case_id: str) -> List[Dict[str, Any]]:
         """Load all documents for a specific case."""
@@ -23,10 +33,10 @@ class DocumentsService:
             backend_dir = Path(__file__).parent.parent.parent
             case_docs_path = backend_dir / "data" / "cases" / "case_documents" / "case_documents_index.json"
             
-            if not case_docs_path.exists():
+            if not DocumentsService._exists(case_docs_path):
                 return []
             
-            with open(case_docs_path, 'r', encoding='utf-8') as f:
+            with DocumentsService._open_index(case_docs_path) as f:
                 data = json.load(f)
                 
                 # Handle both flat array and nested structure
@@ -51,10 +61,10 @@ class DocumentsService:
             # First, find the document in the index to get its path
             case_docs_path = backend_dir / "data" / "cases" / "case_documents" / "case_documents_index.json"
             
-            if not case_docs_path.exists():
+            if not DocumentsService._exists(case_docs_path):
                 return None
             
-            with open(case_docs_path, 'r', encoding='utf-8') as f:
+            with DocumentsService._open_index(case_docs_path) as f:
                 data = json.load(f)
             
             # Handle both flat array and nested structure
@@ -71,7 +81,7 @@ class DocumentsService:
             # Load content from the document's file path
             if 'full_content_path' in document:
                 content_path = backend_dir / "data" / document['full_content_path']
-                if content_path.exists():
+                if DocumentsService._exists(content_path):
                     with open(content_path, 'r', encoding='utf-8') as f:
                         return f.read()
             
@@ -89,10 +99,10 @@ class DocumentsService:
             backend_dir = Path(__file__).parent.parent.parent
             case_docs_path = backend_dir / "data" / "cases" / "case_documents" / "case_documents_index.json"
             
-            if not case_docs_path.exists():
+            if not DocumentsService._exists(case_docs_path):
                 return None
             
-            with open(case_docs_path, 'r', encoding='utf-8') as f:
+            with DocumentsService._open_index(case_docs_path) as f:
                 data = json.load(f)
             
             # Handle both flat array and nested structure
@@ -9,31 +9,134 @@ This service handles playbook-related operations including:
 """
 
 import json
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple
 from datetime import datetime
 
 
+# Keywords that signal each known rule condition in a case summary
+_CONDITION_KEYWORDS = {
+    'termination_within_protected_period': ['termination', 'dismissal', 'fired', 'protected'],
+    'age_over_40_and_replaced_by_younger': ['age', 'discrimination', 'younger', 'replaced'],
+    'documented_performance_issues': ['performance', 'issues', 'documented', 'problems'],
+    'hostile_work_environment_pattern': ['hostile', 'harassment', 'bullying', 'environment'],
+    'whistleblower_activity': ['whistleblower', 'reporting', 'violations', 'safety'],
+    'pregnancy_or_family_leave_involved': ['pregnancy', 'maternity', 'family', 'leave'],
+    'disability_accommodation_denied': ['disability', 'accommodation', 'denied', 'adjustments'],
+    'clear_contract_terms_violated': ['breach', 'violation', 'failed to', 'did not'],
+    'ambiguous_contract_language': ['ambiguous', 'unclear', 'disputed', 'interpretation'],
+    'non_compete_violation': ['non-compete', 'competition', 'competitor', 'restraint'],
+    'damages_easily_calculable': ['damages', 'loss', 'financial', 'calculable'],
+    'ongoing_harm_occurring': ['ongoing', 'continuing', 'harm', 'damage'],
+    'force_majeure_claimed': ['force majeure', 'impossible', 'unforeseen', 'circumstances'],
+    'statute_of_frauds_issue': ['writing', 'written', 'signed', 'agreement'],
+    'clear_debt_documentation': ['debt', 'invoice', 'payment', 'owed'],
+    'debtor_disputes_amount': ['dispute', 'disagree', 'contest', 'challenge'],
+    'debtor_claims_defective_services': ['defective', 'poor quality', 'unsatisfactory', 'substandard'],
+    'debt_over_statute_limitations': ['old debt', 'statute', 'limitations', 'time-barred'],
+    'debtor_has_assets': ['assets', 'property', 'income', 'resources'],
+    'consumer_debt_uk_applies': ['consumer', 'personal', 'individual', 'household'],
+    'debtor_filed_bankruptcy': ['bankruptcy', 'insolvency', 'administration', 'liquidation'],
+    'personal_guarantee_exists': ['guarantee', 'guarantor', 'personal liability', 'surety'],
+    'clear_liability_established': ['liability', 'fault', 'negligence', 'responsible'],
+    'comparative_negligence_issue': ['comparative', 'contributory', 'shared fault', 'partial blame'],
+    'serious_permanent_injury': ['serious', 'permanent', 'disability', 'life-changing'],
+    'insurance_coverage_adequate': ['insurance', 'coverage', 'policy', 'insured']
+}
+
+# One precompiled alternation per condition so a summary is scanned once per condition
+_CONDITION_PATTERNS = {
+    condition: re.compile("|".join(re.escape(keyword) for keyword in keywords))
+    for condition, keywords in _CONDITION_KEYWORDS.items()
+}
+
+# First characters of each condition's keywords; a summary lacking all of them cannot match
+_CONDITION_FIRST_CHARS = {
+    condition: frozenset(keyword[0] for keyword in keywords)
+    for condition, keywords in _CONDITION_KEYWORDS.items()
+}
+
+# Mock precedents per area of law, checked in order against the case type
+_PRECEDENTS_BY_AREA = {
+    "Employment": (
+        {
+            "id": "employment_precedent_1",
+            "title": "Employment Rights Act 1996 - Unfair Dismissal",
+            "category": "statutes",
+            "relevance": "Primary legislation governing employment termination",
+            "key_principle": "Employees have right not to be unfairly dismissed"
+        },
+        {
+            "id": "employment_precedent_2",
+            "title": "Equality Act 2010 - Discrimination Protection",
+            "category": "statutes",
+            "relevance": "Protection against workplace discrimination",
+            "key_principle": "Prohibition of discrimination based on protected characteristics"
+        }
+    ),
+    "Contract": (
+        {
+            "id": "contract_precedent_1",
+            "title": "Sale of Goods Act 1979 - Contract Performance",
+            "category": "statutes",
+            "relevance": "Fundamental contract law principles",
+            "key_principle": "Contracts must be performed according to their terms"
+        },
+        {
+            "id": "contract_precedent_2",
+            "title": "Unfair Contract Terms Act 1977 - Term Validity",
+            "category": "statutes",
+            "relevance": "Regulation of unfair contract terms",
+            "key_principle": "Certain contract terms may be unenforceable if unfair"
+        }
+    ),
+    "Intellectual Property": (
+        {
+            "id": "ip_precedent_1",
+            "title": "Copyright, Designs and Patents Act 1988",
+            "category": "statutes",
+            "relevance": "Intellectual property protection framework",
+            "key_principle": "Protection of creative works and inventions"
+        },
+    )
+}
+
+
 class PlaybooksService:
     """Service for playbook operations."""
     
+    PLAYBOOKS_INDEX_PATH = Path(__file__).parent.parent.parent / "data" / "playbooks" / "playbooks_index.json"
+    
     @staticmethod
     def load_playbooks() -> List[Dict[str, Any]]:
         """Load all playbooks from the playbooks index."""
         try:
-            backend_dir = Path(__file__).parent.parent.parent
-            playbooks_index_path = backend_dir / "data" / "playbooks" / "playbooks_index.json"
+            playbooks_index_path = PlaybooksService.PLAYBOOKS_INDEX_PATH
             
             if not playbooks_index_path.exists():
                 return []
             
-            with open(playbooks_index_path, 'r', encoding='utf-8') as f:
-                playbooks_data = json.load(f)
-                return playbooks_data.get('playbooks', [])
+            # Re-parse only when the index file changes
+            mtime_ns = playbooks_index_path.stat().st_mtime_ns
+            return list(PlaybooksService._read_playbooks_index(playbooks_index_path, mtime_ns))
         except Exception as e:
             print(f"Error loading playbooks: {e}")
             return []
     
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _read_playbooks_index(playbooks_index_path: Path, mtime_ns: int) -> Tuple[Dict[str, Any], ...]:
+        """Parse the playbooks index; cached per path and modification time."""
+        with open(playbooks_index_path, 'rb') as f:
+            playbooks_data = json.load(f)
+        
+        # The index is a bare list; older indexes wrap it under "playbooks"
+        if isinstance(playbooks_data, list):
+            return tuple(playbooks_data)
+        return tuple(playbooks_data.get('playbooks', []))
+    
     @staticmethod
     def match_playbook(case_type: str) -> Optional[Dict[str, Any]]:
         """Match playbook for case type."""
@@ -94,7 +197,7 @@ class PlaybooksService:
                     "supporting_evidence": playbook_result.get('supporting_evidence', [])
                 },
                 "strategic_recommendations": PlaybooksService._generate_strategic_recommendations(playbook_result),
-                "relevant_precedents": PlaybooksService._get_relevant_precedents(case_type),
+                "relevant_precedents": list(PlaybooksService._get_relevant_precedents(case_type)),
                 "applied_playbook": {
                     "id": playbook.get('id'),
                     "name": playbook.get('name'),
@@ -139,8 +242,11 @@ class PlaybooksService:
         supporting_evidence = []
         total_weight = 0.0
         
+        # Lower-case the case text once rather than once per rule
+        case_text = PlaybooksService._case_text(case)
+        
         for rule in rules:
-            if PlaybooksService._evaluate_rule_condition(case, rule):
+            if PlaybooksService._evaluate_rule_condition(case, rule, case_text):
                 applied_rules.append(rule.get('id', ''))
                 
                 # Add rule's action as recommendation
@@ -189,46 +295,31 @@ class PlaybooksService:
         }
     
     @staticmethod
-    def _evaluate_rule_condition(case: Dict[str, Any], rule: Dict[str, Any]) -> bool:
+    def _case_text(case: Dict[str, Any]) -> Tuple[str, str]:
+        """Lower-cased case summary and case type used for rule matching."""
+        return case.get('summary', '').lower(), case.get('case_type', '').lower()
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _matched_conditions(case_summary: str) -> FrozenSet[str]:
+        """All known conditions whose keywords appear in a lower-cased case summary."""
+        summary_chars = frozenset(case_summary)
+        return frozenset(
+            condition for condition, pattern in _CONDITION_PATTERNS.items()
+            if not _CONDITION_FIRST_CHARS[condition].isdisjoint(summary_chars)
+            and pattern.search(case_summary)
+        )
+    
+    @staticmethod
+    def _evaluate_rule_condition(case: Dict[str, Any], rule: Dict[str, Any],
+                                 case_text: Optional[Tuple[str, str]] = None) -> bool:
         """Evaluate if a rule condition applies to a case."""
         condition = rule.get('condition', '').lower()
-        case_summary = case.get('summary', '').lower()
-        case_type = case.get('case_type', '').lower()
-        
-        # Simple keyword matching for common conditions
-        condition_keywords = {
-            'termination_within_protected_period': ['termination', 'dismissal', 'fired', 'protected'],
-            'age_over_40_and_replaced_by_younger': ['age', 'discrimination', 'younger', 'replaced'],
-            'documented_performance_issues': ['performance', 'issues', 'documented', 'problems'],
-            'hostile_work_environment_pattern': ['hostile', 'harassment', 'bullying', 'environment'],
-            'whistleblower_activity': ['whistleblower', 'reporting', 'violations', 'safety'],
-            'pregnancy_or_family_leave_involved': ['pregnancy', 'maternity', 'family', 'leave'],
-            'disability_accommodation_denied': ['disability', 'accommodation', 'denied', 'adjustments'],
-            'clear_contract_terms_violated': ['breach', 'violation', 'failed to', 'did not'],
-            'ambiguous_contract_language': ['ambiguous', 'unclear', 'disputed', 'interpretation'],
-            'non_compete_violation': ['non-compete', 'competition', 'competitor', 'restraint'],
-            'damages_easily_calculable': ['damages', 'loss', 'financial', 'calculable'],
-            'ongoing_harm_occurring': ['ongoing', 'continuing', 'harm', 'damage'],
-            'force_majeure_claimed': ['force majeure', 'impossible', 'unforeseen', 'circumstances'],
-            'statute_of_frauds_issue': ['writing', 'written', 'signed', 'agreement'],
-            'clear_debt_documentation': ['debt', 'invoice', 'payment', 'owed'],
-            'debtor_disputes_amount': ['dispute', 'disagree', 'contest', 'challenge'],
-            'debtor_claims_defective_services': ['defective', 'poor quality', 'unsatisfactory', 'substandard'],
-            'debt_over_statute_limitations': ['old debt', 'statute', 'limitations', 'time-barred'],
-            'debtor_has_assets': ['assets', 'property', 'income', 'resources'],
-            'consumer_debt_uk_applies': ['consumer', 'personal', 'individual', 'household'],
-            'debtor_filed_bankruptcy': ['bankruptcy', 'insolvency', 'administration', 'liquidation'],
-            'personal_guarantee_exists': ['guarantee', 'guarantor', 'personal liability', 'surety'],
-            'clear_liability_established': ['liability', 'fault', 'negligence', 'responsible'],
-            'comparative_negligence_issue': ['comparative', 'contributory', 'shared fault', 'partial blame'],
-            'serious_permanent_injury': ['serious', 'permanent', 'disability', 'life-changing'],
-            'insurance_coverage_adequate': ['insurance', 'coverage', 'policy', 'insured']
-        }
+        case_summary, case_type = case_text or PlaybooksService._case_text(case)
         
         # Check if condition keywords appear in case summary
-        if condition in condition_keywords:
-            keywords = condition_keywords[condition]
-            return any(keyword in case_summary for keyword in keywords)
+        if condition in _CONDITION_KEYWORDS:
+            return condition in PlaybooksService._matched_conditions(case_summary)
         
         # Fallback: simple substring matching
         return condition in case_summary or condition in case_type
@@ -261,8 +352,12 @@ class PlaybooksService:
     @staticmethod
     def _generate_reasoning(applied_rules: List[str], case_strength: str, total_rules: int) -> str:
         """Generate reasoning text for the case assessment."""
-        rules_count = len(applied_rules)
-        
+        return PlaybooksService._reasoning_text(len(applied_rules), case_strength, total_rules)
+    
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _reasoning_text(rules_count: int, case_strength: str, total_rules: int) -> str:
+        """Reasoning text for a given rule count and case strength (memoized)."""
         if rules_count == 0:
             return "No applicable rules found. Case assessment is inconclusive based on available playbook rules."
         
@@ -282,9 +377,16 @@ class PlaybooksService:
     @staticmethod
     def _generate_strategic_recommendations(playbook_result: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate strategic recommendations from playbook results."""
+        return list(PlaybooksService._strategic_recommendations(
+            playbook_result.get('case_strength', 'Weak'),
+            tuple(playbook_result.get('applied_rules', []))
+        ))
+    
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _strategic_recommendations(case_strength: str, applied_rules: Tuple[str, ...]) -> Tuple[Dict[str, Any], ...]:
+        """Strategic recommendations for a case strength and set of applied rules (memoized)."""
         recommendations = []
-        case_strength = playbook_result.get('case_strength', 'Weak')
-        applied_rules = playbook_result.get('applied_rules', [])
         
         # Base recommendations on case strength
         if case_strength == "Strong":
@@ -366,60 +468,18 @@ class PlaybooksService:
                     "supporting_precedents": ["Contract interpretation", "Performance standards"]
                 })
         
-        return recommendations[:5]  # Limit to 5 recommendations
+        return tuple(recommendations[:5])  # Limit to 5 recommendations
     
     @staticmethod
-    def _get_relevant_precedents(case_type: str) -> List[Dict[str, Any]]:
-        """Get relevant legal precedents based on case type."""
+    @lru_cache(maxsize=32)
+    def _get_relevant_precedents(case_type: str) -> Tuple[Dict[str, Any], ...]:
+        """Get relevant legal precedents based on case type (memoized)."""
         # This would typically query the legal corpus, but for now return mock data
-        precedents = []
-        
-        if "Employment" in case_type:
-            precedents.extend([
-                {
-                    "id": "employment_precedent_1",
-                    "title": "Employment Rights Act 1996 - Unfair Dismissal",
-                    "category": "statutes",
-                    "relevance": "Primary legislation governing employment termination",
-                    "key_principle": "Employees have right not to be unfairly dismissed"
-                },
-                {
-                    "id": "employment_precedent_2", 
-                    "title": "Equality Act 2010 - Discrimination Protection",
-                    "category": "statutes",
-                    "relevance": "Protection against workplace discrimination",
-                    "key_principle": "Prohibition of discrimination based on protected characteristics"
-                }
-            ])
-        elif "Contract" in case_type:
-            precedents.extend([
-                {
-                    "id": "contract_precedent_1",
-                    "title": "Sale of Goods Act 1979 - Contract Performance",
-                    "category": "statutes", 
-                    "relevance": "Fundamental contract law principles",
-                    "key_principle": "Contracts must be performed according to their terms"
-                },
-                {
-                    "id": "contract_precedent_2",
-                    "title": "Unfair Contract Terms Act 1977 - Term Validity",
-                    "category": "statutes",
-                    "relevance": "Regulation of unfair contract terms",
-                    "key_principle": "Certain contract terms may be unenforceable if unfair"
-                }
-            ])
-        elif "Intellectual Property" in case_type:
-            precedents.extend([
-                {
-                    "id": "ip_precedent_1",
-                    "title": "Copyright, Designs and Patents Act 1988",
-                    "category": "statutes",
-                    "relevance": "Intellectual property protection framework",
-                    "key_principle": "Protection of creative works and inventions"
-                }
-            ])
+        for area, precedents in _PRECEDENTS_BY_AREA.items():
+            if area in case_type:
+                return precedents
         
-        return precedents
+        return ()
     
     @staticmethod
     def _generate_fallback_analysis(case_id: str, reason: str) -> Dict[str, Any]:
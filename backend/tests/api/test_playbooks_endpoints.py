@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+API Tests for Playbooks Endpoints
+
+Tests for the playbooks API including:
+- GET /api/playbooks/
+- GET /api/playbooks/{case_type}
+- GET /api/playbooks/match/{case_type}
+- POST /api/playbooks/cases/{case_id}/comprehensive-analysis
+"""
+
+import pytest
+import asyncio
+import httpx
+from collections import namedtuple
+from contextlib import ExitStack
+from unittest.mock import patch
+from fastapi import HTTPException
+
+from app.services.playbooks_service import PlaybooksService
+from main import app
+
+
+# A single playbook as returned by the service for a known case type
+_PLAYBOOK = {
+    "id": "employment-dispute",
+    "name": "Employment Law Playbook",
+    "case_type": "Employment Dispute",
+    "rules": []
+}
+
+# A large playbook list, built once at import for the throughput smoke test
+_LARGE_PLAYBOOK_LIST = [
+    {
+        "id": f"playbook-{i}",
+        "name": f"Playbook {i}",
+        "case_type": f"Case Type {i}",
+        "rules": [],
+        "decision_tree": {},
+        "monetary_ranges": {},
+        "escalation_paths": []
+    }
+    for i in range(100)
+]
+
+
+ServiceMocks = namedtuple("ServiceMocks", ["load_playbooks", "match_playbook", "analyze_case_with_playbook"])
+
+
+@pytest.fixture(scope="class")
+def _service_patches():
+    """Patch the PlaybooksService calls made by the router once per test class"""
+    with ExitStack() as stack:
+        yield ServiceMocks(*(
+            stack.enter_context(patch.object(PlaybooksService, name, autospec=True))
+            for name in ServiceMocks._fields
+        ))
+
+
+@pytest.fixture
+def service_mocks(_service_patches):
+    """The class-wide PlaybooksService mocks, reset for each test"""
+    for mock in _service_patches:
+        mock.reset_mock(return_value=True, side_effect=True)
+    return _service_patches
+
+
+class TestPlaybooksEndpoints:
+    """Test class for playbooks API endpoints"""
+
+    def test_get_all_playbooks_success(self, client, service_mocks, sample_playbook_data):
+        """Test successful retrieval of all playbooks"""
+        service_mocks.load_playbooks.return_value = [sample_playbook_data]
+
+        response = client.get("/api/playbooks/")
+
+        assert response.status_code == 200
+        assert response.json() == [sample_playbook_data]
+        service_mocks.load_playbooks.assert_called_once_with()
+
+    @pytest.mark.slow
+    def test_get_all_playbooks_large_dataset(self, client, service_mocks):
+        """Test retrieval of a large playbook list"""
+        service_mocks.load_playbooks.return_value = _LARGE_PLAYBOOK_LIST
+
+        response = client.get("/api/playbooks/")
+
+        assert response.status_code == 200
+        assert response.json() == _LARGE_PLAYBOOK_LIST
+
+    def test_get_all_playbooks_internal_error(self, client, service_mocks):
+        """Test retrieval of all playbooks with internal server error"""
+        service_mocks.load_playbooks.side_effect = Exception("Index unreadable")
+
+        response = client.get("/api/playbooks/")
+
+        assert response.status_code == 500
+        assert "Failed to get playbooks" in response.json()["detail"]
+
+    @pytest.mark.parametrize("case_type, playbook, error, expected_status, expected_detail", [
+        ("Employment Dispute", _PLAYBOOK, None, 200, None),
+        ("Unknown Type", None, None, 404, "No playbook found for case type: Unknown Type"),
+        ("Employment Dispute", None, Exception("Index unreadable"), 500, "Failed to get playbook: Index unreadable"),
+        ("Employment Dispute", None, HTTPException(status_code=403, detail="Forbidden"), 403, "Forbidden"),
+        ("Employment & Wages (UK)", None, None, 404, "No playbook found for case type: Employment & Wages (UK)"),
+    ], ids=["success", "not_found", "service_error", "http_exception_passthrough", "special_characters"])
+    def test_get_playbook(self, client, service_mocks, case_type, playbook, error,
+                          expected_status, expected_detail):
+        """Test retrieval of a playbook by case type across service outcomes"""
+        service_mocks.match_playbook.return_value = playbook
+        service_mocks.match_playbook.side_effect = error
+
+        response = client.get(f"/api/playbooks/{case_type}")
+
+        assert response.status_code == expected_status
+        assert response.json() == (playbook if expected_detail is None else {"detail": expected_detail})
+        service_mocks.match_playbook.assert_called_once_with(case_type)
+
+    def test_match_playbook_success(self, client, service_mocks, sample_playbook_data):
+        """Test successful playbook match for a case type"""
+        service_mocks.match_playbook.return_value = sample_playbook_data
+
+        response = client.get("/api/playbooks/match/Employment Dispute")
+
+        assert response.status_code == 200
+        assert response.json()["id"] == "employment_playbook"
+
+    def test_match_playbook_not_found(self, client, service_mocks):
+        """Test playbook match for an unknown case type"""
+        service_mocks.match_playbook.return_value = None
+
+        response = client.get("/api/playbooks/match/Unknown Type")
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == "No playbook found for case type: Unknown Type"
+
+    def test_comprehensive_analysis_success(self, client, service_mocks):
+        """Test successful comprehensive case analysis"""
+        case_id = "case-001"
+        expected_analysis = {
+            "case_id": case_id,
+            "case_strength_assessment": {"overall_strength": "Moderate", "confidence_level": 0.75},
+            "strategic_recommendations": [],
+            "relevant_precedents": [],
+            "applied_playbook": {"id": "employment_playbook"},
+            "analysis_timestamp": "2024-01-15T10:30:00"
+        }
+        service_mocks.analyze_case_with_playbook.return_value = expected_analysis
+
+        response = client.post(f"/api/playbooks/cases/{case_id}/comprehensive-analysis")
+
+        assert response.status_code == 200
+        assert response.json() == expected_analysis
+        service_mocks.analyze_case_with_playbook.assert_called_once_with(case_id)
+
+    def test_comprehensive_analysis_internal_error(self, client, service_mocks):
+        """Test comprehensive case analysis with internal server error"""
+        service_mocks.analyze_case_with_playbook.side_effect = Exception("Analysis engine unavailable")
+
+        response = client.post("/api/playbooks/cases/case-001/comprehensive-analysis")
+
+        assert response.status_code == 500
+        assert "Failed to perform comprehensive analysis" in response.json()["detail"]
+
+
+AnalysisMocks = namedtuple("AnalysisMocks", ["find_case", "match_playbook", "apply_rules"])
+
+
+@pytest.fixture
+def analysis_mocks():
+    """Patch the case lookup, playbook match and rule application behind comprehensive analysis"""
+    with ExitStack() as stack:
+        yield AnalysisMocks(
+            find_case=stack.enter_context(patch('app.services.cases_service.CasesService.find_case_by_id')),
+            match_playbook=stack.enter_context(patch('app.api.playbooks.PlaybooksService.match_playbook')),
+            apply_rules=stack.enter_context(patch('app.api.playbooks.PlaybooksService._apply_playbook_rules'))
+        )
+
+
+class TestComprehensiveAnalysisWorkflow:
+    """Test class for comprehensive analysis through the real PlaybooksService"""
+
+    def test_comprehensive_analysis_applies_playbook(self, client, analysis_mocks,
+                                                    sample_case_data, sample_playbook_data):
+        """Test the analysis reports the outcome of the applied playbook rules"""
+        analysis_mocks.find_case.return_value = sample_case_data
+        analysis_mocks.match_playbook.return_value = sample_playbook_data
+        analysis_mocks.apply_rules.return_value = {
+            "applied_rules": ["protected_termination"],
+            "case_strength": "Moderate",
+            "confidence_level": 0.62,
+            "key_strengths": ["Strong case for retaliation if termination occurred within protected period"],
+            "potential_weaknesses": [],
+            "supporting_evidence": ["Termination timeline"]
+        }
+
+        response = client.post("/api/playbooks/cases/case_001/comprehensive-analysis")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["case_strength_assessment"]["overall_strength"] == "Moderate"
+        assert data["case_strength_assessment"]["confidence_level"] == 0.62
+        assert data["applied_playbook"]["id"] == "employment_playbook"
+        analysis_mocks.find_case.assert_called_once_with("case_001")
+        analysis_mocks.match_playbook.assert_called_once_with("Employment Dispute")
+        analysis_mocks.apply_rules.assert_called_once_with(sample_case_data, sample_playbook_data)
+
+    def test_comprehensive_analysis_no_playbook(self, client, analysis_mocks, sample_case_data):
+        """Test the analysis falls back when no playbook matches the case type"""
+        analysis_mocks.find_case.return_value = sample_case_data
+        analysis_mocks.match_playbook.return_value = None
+
+        response = client.post("/api/playbooks/cases/case_001/comprehensive-analysis")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["applied_playbook"] is None
+        assert data["fallback_reason"] == "No playbook found for case type: Employment Dispute"
+        analysis_mocks.apply_rules.assert_not_called()
+
+    def test_comprehensive_analysis_rule_engine_error(self, client, analysis_mocks,
+                                                      sample_case_data, sample_playbook_data):
+        """Test a rule application failure is reported as a fallback analysis"""
+        analysis_mocks.find_case.return_value = sample_case_data
+        analysis_mocks.match_playbook.return_value = sample_playbook_data
+        analysis_mocks.apply_rules.side_effect = Exception("Rule engine failure")
+
+        response = client.post("/api/playbooks/cases/case_001/comprehensive-analysis")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["applied_playbook"] is None
+        assert data["fallback_reason"] == "Analysis error: Rule engine failure"
+
+
+@pytest.fixture(scope="session")
+def documentation_responses():
+    """Fetch the OpenAPI spec and an empty playbook list concurrently, once per session"""
+    async def fetch():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+            return await asyncio.gather(
+                async_client.get("/openapi.json"),
+                async_client.get("/api/playbooks/")
+            )
+
+    with patch('app.api.playbooks.PlaybooksService.load_playbooks', return_value=[]):
+        return asyncio.run(fetch())
+
+
+@pytest.fixture(scope="session")
+def openapi_spec(documentation_responses):
+    """The OpenAPI schema FastAPI cached while serving /openapi.json"""
+    assert documentation_responses[0].status_code == 200
+    return app.openapi_schema
+
+
+@pytest.fixture(scope="session")
+def empty_playbooks_response(documentation_responses):
+    """The playbook list response with no playbooks available"""
+    return documentation_responses[1]
+
+
+class TestPlaybooksDocumentation:
+    """Test class for playbooks API documentation and response format"""
+
+    def test_openapi_schema_cached(self, openapi_spec):
+        """Test the served schema is generated once and reused by the app"""
+        assert openapi_spec is not None
+        assert app.openapi() is openapi_spec
+
+    def test_playbook_routes_documented(self, openapi_spec):
+        """Test every playbooks route appears in the OpenAPI spec"""
+        assert {
+            "/api/playbooks/",
+            "/api/playbooks/{case_type}",
+            "/api/playbooks/match/{case_type}",
+            "/api/playbooks/cases/{case_id}/comprehensive-analysis"
+        } <= openapi_spec["paths"].keys()
+
+    def test_playbook_routes_tagged(self, openapi_spec):
+        """Test playbooks operations are grouped under the Playbooks tag"""
+        operations = [
+            operation
+            for path, methods in openapi_spec["paths"].items() if path.startswith("/api/playbooks/")
+            for operation in methods.values()
+        ]
+
+        assert operations
+        assert all(operation["tags"] == ["Playbooks"] for operation in operations)
+
+    def test_response_content_type(self, empty_playbooks_response):
+        """Test the playbook list is served as JSON"""
+        assert empty_playbooks_response.status_code == 200
+        assert empty_playbooks_response.headers["content-type"] == "application/json"
+
+    def test_empty_playbooks_response(self, empty_playbooks_response):
+        """Test an empty playbook list is returned as an empty JSON array"""
+        assert empty_playbooks_response.json() == []
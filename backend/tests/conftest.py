@@ -1,12 +1,23 @@
+import os
 import pytest
 from fastapi.testclient import TestClient
 from main import app
 
-@pytest.fixture
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """Re-run last failures first locally; start from a clean cache on CI"""
+    # tryfirst so the options are set before the cache plugin reads them
+    if os.getenv("CI"):
+        config.option.cacheclear = True
+    else:
+        config.option.failedfirst = True
+
+@pytest.fixture(scope="session")
 def client():
+    """One TestClient per session (per worker under pytest-xdist)"""
     return TestClient(app)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_case_data():
     """Sample case data for testing"""
     return {
@@ -20,7 +31,7 @@ def sample_case_data():
         "created_date": "2024-01-15"
     }
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_document_data():
     """Sample document data for testing"""
     return {
@@ -33,7 +44,7 @@ def sample_document_data():
         "upload_date": "2024-01-15"
     }
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_playbook_data():
     """Sample playbook data for testing"""
     return {
@@ -61,7 +72,7 @@ def sample_playbook_data():
         ]
     }
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_corpus_data():
     """Sample corpus data for testing"""
     return {
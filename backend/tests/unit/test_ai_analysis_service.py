@@ -19,9 +19,12 @@ class TestAIAnalysisService:
     @patch.dict('os.environ', {'CLAUDE_API_KEY': 'test-key'})
     @patch('app.services.ai_analysis_service.ClaudeClient')
     @patch('app.services.ai_analysis_service.DocumentExtractor')
-    def ai_service(self, mock_doc_extractor, mock_claude_client):
+    def ai_service(self, mock_doc_extractor, mock_claude_client, tmp_path):
         """Create AIAnalysisService instance for testing"""
-        return AIAnalysisService()
+        service = AIAnalysisService()
+        # Keep conversation logs written on failure paths out of the real data tree
+        service.ai_data_dir = tmp_path / "ai" / "cases"
+        return service
 
     @pytest.fixture
     def mock_case_data(self):
@@ -124,7 +127,7 @@ class TestAIAnalysisService:
         
         assert result is None
 
-    @patch("builtins.open", side_effect=Exception("File error"))
+    @patch("app.services.ai_analysis_service.open", side_effect=OSError("File error"), create=True)
     @patch("pathlib.Path.exists", return_value=True)
     def test_get_case_analysis_exception(self, mock_exists, mock_file, ai_service):
         """Test case analysis retrieval with exception"""
@@ -271,7 +274,7 @@ class TestAIAnalysisService:
         with pytest.raises(Exception, match="Document extraction failed"):
             ai_service.analyze_case("case-001")
 
-    @patch("builtins.open", side_effect=Exception("File write error"))
+    @patch("app.services.ai_analysis_service.open", side_effect=OSError("File write error"), create=True)
     @patch("pathlib.Path.mkdir")
     def test_store_analysis_result_error(self, mock_mkdir, mock_file, ai_service):
         """Test storing analysis result with file write error"""
@@ -280,7 +283,7 @@ class TestAIAnalysisService:
         with pytest.raises(Exception, match="File write error"):
             ai_service._store_analysis_result("case-001", analysis_result)
 
-    @patch("builtins.open", side_effect=Exception("Conversation log error"))
+    @patch("app.services.ai_analysis_service.open", side_effect=OSError("Conversation log error"), create=True)
     @patch("pathlib.Path.mkdir")
     def test_log_conversation_error_handling(self, mock_mkdir, mock_file, ai_service):
         """Test conversation logging with file error - should not raise"""
@@ -362,7 +365,7 @@ class TestAIAnalysisService:
         
         assert result is None
 
-    @patch("builtins.open", side_effect=Exception("File read error"))
+    @patch("app.services.ai_analysis_service.open", side_effect=OSError("File read error"), create=True)
     @patch("pathlib.Path.exists", return_value=True)
     def test_load_case_data_file_read_error(self, mock_exists, mock_file, ai_service):
         """Test loading case data with file read error"""
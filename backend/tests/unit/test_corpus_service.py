@@ -56,8 +56,7 @@ class TestCorpusService:
         """Test loading corpus categories"""
         result = CorpusService.load_corpus_categories()
         
-        assert "contracts" in result
-        assert "clauses" in result
+        assert {"contracts", "clauses"} <= result.keys()
         assert result["contracts"]["name"] == "Contracts"
         assert "item1" in result["contracts"]["document_ids"]
 
@@ -4,6 +4,7 @@ Unit tests for DocumentsService
 """
 
 import pytest
+import io
 import json
 from unittest.mock import patch, mock_open
 from pathlib import Path
@@ -11,13 +12,42 @@ from pathlib import Path
 from app.services.documents_service import DocumentsService
 
 
+# Index payloads, serialized once at import
+_TWO_CASES_INDEX = json.dumps([{"id": "doc1", "case_id": "case1"}, {"id": "doc2", "case_id": "case2"}]).encode()
+_NAMED_DOC_INDEX = json.dumps([{"id": "doc1", "name": "Test Doc"}]).encode()
+_FULL_CONTENT_INDEX = json.dumps([
+    {
+        "id": "doc1",
+        "full_content_path": "cases/case_documents/doc1.txt",
+        "content_preview": "Preview content"
+    }
+]).encode()
+_PREVIEW_ONLY_INDEX = json.dumps([{"id": "doc1", "content_preview": "Preview content only"}]).encode()
+
+
 class TestDocumentsService:
     """Test cases for DocumentsService"""
 
-    @patch("builtins.open", new_callable=mock_open, read_data='[{"id": "doc1", "case_id": "case1"}, {"id": "doc2", "case_id": "case2"}]')
-    @patch("pathlib.Path.exists", return_value=True)
-    def test_load_case_documents_success(self, mock_exists, mock_file):
+    @pytest.fixture
+    def files_exist(self, monkeypatch):
+        """Report every data file as present"""
+        monkeypatch.setattr(DocumentsService, "_exists", staticmethod(lambda path: True))
+
+    @pytest.fixture
+    def files_missing(self, monkeypatch):
+        """Report every data file as absent"""
+        monkeypatch.setattr(DocumentsService, "_exists", staticmethod(lambda path: False))
+
+    @pytest.fixture
+    def serve_index(self, monkeypatch, files_exist):
+        """Serve the given bytes as the case documents index"""
+        def serve(payload):
+            monkeypatch.setattr(DocumentsService, "_open_index", staticmethod(lambda path: io.BytesIO(payload)))
+        return serve
+
+    def test_load_case_documents_success(self, serve_index):
         """Test loading case documents for specific case"""
+        serve_index(_TWO_CASES_INDEX)
         case_id = "case1"
         
         result = DocumentsService.load_case_documents(case_id)
@@ -26,88 +56,60 @@ class TestDocumentsService:
         assert result[0]["id"] == "doc1"
         assert result[0]["case_id"] == "case1"
 
-    @patch("pathlib.Path.exists", return_value=False)
-    def test_load_case_documents_file_not_exists(self, mock_exists):
+    def test_load_case_documents_file_not_exists(self, files_missing):
         """Test loading case documents when file doesn't exist"""
         result = DocumentsService.load_case_documents("case1")
         
         assert result == []
 
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("pathlib.Path.exists")
-    def test_load_document_content_success(self, mock_exists, mock_file):
+    def test_load_document_content_success(self, serve_index):
         """Test loading document content successfully"""
-        # Mock the index file
-        index_data = [
-            {
-                "id": "doc1",
-                "full_content_path": "cases/case_documents/doc1.txt",
-                "content_preview": "Preview content"
-            }
-        ]
+        serve_index(_FULL_CONTENT_INDEX)
         content_data = "Full document content here"
         
-        def side_effect(path, *args, **kwargs):
-            if "case_documents_index.json" in str(path):
-                return mock_open(read_data=json.dumps(index_data)).return_value
-            else:
-                return mock_open(read_data=content_data).return_value
-        
-        mock_file.side_effect = side_effect
-        mock_exists.return_value = True
-        
-        result = DocumentsService.load_document_content("doc1")
+        # Only the content file goes through builtins.open now
+        with patch("builtins.open", mock_open(read_data=content_data)):
+            result = DocumentsService.load_document_content("doc1")
         
         assert result == content_data
 
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("pathlib.Path.exists")
-    def test_load_document_content_fallback_to_preview(self, mock_exists, mock_file):
+    def test_load_document_content_fallback_to_preview(self, serve_index):
         """Test loading document content falls back to preview when full content not available"""
-        index_data = [
-            {
-                "id": "doc1",
-                "content_preview": "Preview content only"
-            }
-        ]
-        
-        mock_file.return_value = mock_open(read_data=json.dumps(index_data)).return_value
-        # Only the index file exists, not the content file
-        mock_exists.return_value = True
+        serve_index(_PREVIEW_ONLY_INDEX)
         
         result = DocumentsService.load_document_content("doc1")
         
         assert result == "Preview content only"
 
-    @patch("pathlib.Path.exists", return_value=False)
-    def test_load_document_content_file_not_exists(self, mock_exists):
+    def test_load_document_content_file_not_exists(self, files_missing):
         """Test loading document content when file doesn't exist"""
         result = DocumentsService.load_document_content("doc1")
         
         assert result is None
 
-    @patch("builtins.open", new_callable=mock_open, read_data='[{"id": "doc1", "name": "Test Doc"}]')
-    @patch("pathlib.Path.exists", return_value=True)
-    def test_find_document_by_id_success(self, mock_exists, mock_file):
+    def test_find_document_by_id_success(self, serve_index):
         """Test finding document by ID successfully"""
+        serve_index(_NAMED_DOC_INDEX)
         result = DocumentsService.find_document_by_id("doc1")
         
         assert result is not None
         assert result["id"] == "doc1"
         assert result["name"] == "Test Doc"
 
-    @patch("builtins.open", new_callable=mock_open, read_data='[{"id": "doc1", "name": "Test Doc"}]')
-    @patch("pathlib.Path.exists", return_value=True)
-    def test_find_document_by_id_not_found(self, mock_exists, mock_file):
+    def test_find_document_by_id_not_found(self, serve_index):
         """Test finding document by ID when not found"""
+        serve_index(_NAMED_DOC_INDEX)
         result = DocumentsService.find_document_by_id("nonexistent")
         
         assert result is None
 
-    @patch("builtins.open", side_effect=Exception("File error"))
-    @patch("pathlib.Path.exists", return_value=True)
-    def test_find_document_by_id_exception(self, mock_exists, mock_file):
+    def test_find_document_by_id_exception(self, monkeypatch, files_exist):
         """Test finding document by ID with exception"""
+        def failing_open(path):
+            raise Exception("File error")
+        
+        monkeypatch.setattr(DocumentsService, "_open_index", staticmethod(failing_open))
+        
         result = DocumentsService.find_document_by_id("doc1")
         
         assert result is None
\ No newline at end of file
@@ -5,92 +5,272 @@ Unit tests for PlaybooksService
 
 import pytest
 import json
-from unittest.mock import patch, mock_open
-from pathlib import Path
+import os
+from datetime import datetime
 
+from app.services.cases_service import CasesService
 from app.services.playbooks_service import PlaybooksService
 
 
+# Playbooks index entries, written to disk once per session
+_PLAYBOOKS = [{"id": "pb1", "name": "Test Playbook", "case_type": "Employment Dispute"}]
+
+
+# Shared case and playbook fixtures; analysis only reads them
+_MOCK_CASE = {
+    "id": "case1",
+    "case_type": "Employment Dispute",
+    "summary": "Employee termination within protected period after whistleblower reporting of safety violations"
+}
+
+_MOCK_PLAYBOOK = {
+    "id": "pb1",
+    "name": "Employment Playbook",
+    "case_type": "Employment Dispute",
+    "rules": [
+        {
+            "id": "rule1",
+            "condition": "termination_within_protected_period",
+            "weight": 0.9,
+            "action": "Investigate retaliation claims",
+            "description": "Termination within protected period",
+            "evidence_required": ["Termination timeline"]
+        },
+        {
+            "id": "rule2",
+            "condition": "whistleblower_activity",
+            "weight": 0.8,
+            "action": "Gather whistleblowing evidence",
+            "description": "Protected disclosure made",
+            "evidence_required": ["Safety reports"]
+        }
+    ]
+}
+
+_INTEGRATION_CASE = {
+    "id": "integration_case",
+    "case_type": "Employment Dispute",
+    "summary": "Employee fired shortly after whistleblower reporting of safety violations"
+}
+
+_INTEGRATION_PLAYBOOK = {
+    "id": "employment_playbook",
+    "name": "Employment Dispute Playbook",
+    "case_type": "Employment Dispute",
+    "rules": [
+        {
+            "id": "termination_rule",
+            "condition": "termination_within_protected_period",
+            "weight": 0.9,
+            "action": "Investigate retaliation claims",
+            "description": "Termination within protected period",
+            "evidence_required": ["Termination timeline"]
+        },
+        {
+            "id": "whistleblower_rule",
+            "condition": "whistleblower_activity",
+            "weight": 0.8,
+            "action": "Gather whistleblowing evidence",
+            "description": "Protected disclosure made",
+            "evidence_required": ["Safety reports"]
+        },
+        {
+            "id": "age_rule",
+            "condition": "age_over_40_and_replaced_by_younger",
+            "weight": 0.7,
+            "action": "Gather age discrimination evidence",
+            "description": "Replaced by younger employee",
+            "evidence_required": ["Replacement employee details"]
+        }
+    ]
+}
+
+# Fixed clock for analyses whose timestamp is asserted
+_FROZEN_NOW = datetime(2024, 1, 1, 9, 30)
+
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() always returns _FROZEN_NOW"""
+
+    @classmethod
+    def now(cls, tz=None):
+        return _FROZEN_NOW
+
+
+# (condition, case summary, expected) scenarios for rule evaluation
+_RULE_EVAL_CASES = [
+    ("termination_within_protected_period", "Employee was terminated within the protected period", True),
+    ("age_over_40_and_replaced_by_younger", "Long-serving employee replaced by a younger hire", True),
+    ("whistleblower_activity", "Dismissed after reporting safety violations", True),
+    ("non_compete_violation", "Former employee joined a direct competitor", True),
+    ("clear_debt_documentation", "Unpaid invoice for consulting services", True),
+    ("force_majeure_claimed", "Supplier relied on force majeure after the flood", True),
+    ("hostile_work_environment_pattern", "Dispute over software licence fees", False),
+    ("debtor_filed_bankruptcy", "Client paid all invoices on time", False),
+    ("whistleblower_activity", "", False),
+    ("custom_condition", "Summary explicitly mentions custom_condition", True),
+    ("custom_condition", "Nothing relevant here", False),
+]
+
+
+@pytest.fixture(scope="session")
+def playbooks_index_path(tmp_path_factory):
+    """Write the shared playbooks index once per session"""
+    path = tmp_path_factory.mktemp("playbooks") / "playbooks_index.json"
+    path.write_text(json.dumps(_PLAYBOOKS))
+    return path
+
+
 class TestPlaybooksService:
     """Test cases for PlaybooksService"""
 
-    @patch("builtins.open", new_callable=mock_open, read_data='{"playbooks": [{"id": "pb1", "name": "Test Playbook", "case_type": "Employment Dispute"}]}')
-    @patch("pathlib.Path.exists", return_value=True)
-    def test_load_playbooks_success(self, mock_exists, mock_file):
-        """Test loading playbooks successfully"""
-        result = PlaybooksService.load_playbooks()
+    @pytest.fixture
+    def playbooks_index(self, monkeypatch, playbooks_index_path):
+        """Point the service at the shared playbooks index"""
+        monkeypatch.setattr(PlaybooksService, "PLAYBOOKS_INDEX_PATH", playbooks_index_path)
+
+    @pytest.fixture
+    def playbooks_file(self, request, monkeypatch, tmp_path):
+        """Write the parametrized index payload and point the service at it"""
+        path = tmp_path / "playbooks_index.json"
+        path.write_text(json.dumps(request.param))
+        monkeypatch.setattr(PlaybooksService, "PLAYBOOKS_INDEX_PATH", path)
+        return path
+
+    @pytest.fixture
+    def stub_services(self, monkeypatch):
+        """Stub the case lookup and playbook match with plain dict lookups by id and case type"""
+        def stub(cases, playbooks=None):
+            monkeypatch.setattr(CasesService, "find_case_by_id", staticmethod(cases.get))
+            monkeypatch.setattr(PlaybooksService, "match_playbook", staticmethod((playbooks or {}).get))
+        return stub
+
+    @pytest.mark.parametrize("playbooks_file", [_PLAYBOOKS, {"playbooks": _PLAYBOOKS}],
+                             ids=["list", "wrapped"], indirect=True)
+    def test_load_playbooks_success(self, playbooks_file):
+        """Test loading playbooks from a bare or wrapped index"""
+        assert PlaybooksService.load_playbooks() == _PLAYBOOKS
+
+    @pytest.mark.parametrize("playbooks_file", [_PLAYBOOKS], indirect=True)
+    def test_load_playbooks_rereads_changed_index(self, playbooks_file):
+        """Test a cached index is re-read once the file is modified"""
+        assert PlaybooksService.load_playbooks() == _PLAYBOOKS
         
-        assert len(result) == 1
-        assert result[0]["id"] == "pb1"
-        assert result[0]["name"] == "Test Playbook"
+        updated = [{"id": "pb2", "name": "Updated Playbook", "case_type": "Contract Breach"}]
+        playbooks_file.write_text(json.dumps(updated))
+        mtime_ns = playbooks_file.stat().st_mtime_ns + 1_000_000_000
+        os.utime(playbooks_file, ns=(mtime_ns, mtime_ns))
+        
+        assert PlaybooksService.load_playbooks() == updated
 
-    @patch("pathlib.Path.exists", return_value=False)
-    def test_load_playbooks_file_not_exists(self, mock_exists):
+    def test_load_playbooks_file_not_exists(self, monkeypatch, tmp_path):
         """Test loading playbooks when file doesn't exist"""
+        monkeypatch.setattr(PlaybooksService, "PLAYBOOKS_INDEX_PATH", tmp_path / "missing.json")
+        
         result = PlaybooksService.load_playbooks()
         
         assert result == []
 
-    @patch("builtins.open", new_callable=mock_open, read_data='{"playbooks": [{"id": "pb1", "case_type": "Employment Dispute"}]}')
-    @patch("pathlib.Path.exists", return_value=True)
-    def test_match_playbook_success(self, mock_exists, mock_file):
-        """Test successful playbook matching"""
-        result = PlaybooksService.match_playbook("Employment Dispute")
-        
-        assert result is not None
-        assert result["id"] == "pb1"
-        assert result["case_type"] == "Employment Dispute"
+    @pytest.mark.parametrize("method, arg, expected", [
+        ("match_playbook", "Employment Dispute", _PLAYBOOKS[0]),
+        ("match_playbook", "Intellectual Property", None),
+        ("get_playbook_by_id", "pb1", _PLAYBOOKS[0]),
+        ("get_playbook_by_id", "nonexistent", None),
+    ])
+    def test_playbook_lookup(self, playbooks_index, method, arg, expected):
+        """Test playbook lookup by case type and by ID"""
+        assert getattr(PlaybooksService, method)(arg) == expected
 
-    @patch("builtins.open", new_callable=mock_open, read_data='{"playbooks": [{"id": "pb1", "case_type": "Employment Dispute"}]}')
-    @patch("pathlib.Path.exists", return_value=True)
-    def test_match_playbook_no_match(self, mock_exists, mock_file):
-        """Test playbook matching when no match found"""
-        result = PlaybooksService.match_playbook("Intellectual Property")
+    def test_analyze_case_with_playbook_success(self, stub_services):
+        """Test case analysis with a matching playbook"""
+        stub_services({"case1": _MOCK_CASE}, {"Employment Dispute": _MOCK_PLAYBOOK})
+        
+        result = PlaybooksService.analyze_case_with_playbook("case1")
         
-        assert result is None
+        assert result["case_id"] == "case1"
+        assert result["applied_playbook"]["id"] == "pb1"
+        assert result["case_strength_assessment"]["overall_strength"] == "Strong"
+        assert len(result["strategic_recommendations"]) > 0
+        assert len(result["relevant_precedents"]) > 0
 
-    @patch("builtins.open", new_callable=mock_open, read_data='{"playbooks": [{"id": "pb1", "name": "Test Playbook"}]}')
-    @patch("pathlib.Path.exists", return_value=True)
-    def test_get_playbook_by_id_success(self, mock_exists, mock_file):
-        """Test getting playbook by ID successfully"""
-        result = PlaybooksService.get_playbook_by_id("pb1")
+    @pytest.mark.parametrize("cases, expected_reason", [
+        ({}, "Case not found"),
+        ({"case1": {"id": "case1", "summary": "Test case"}}, "No case type specified"),
+        ({"case1": {"id": "case1", "case_type": "Unknown"}}, "No playbook found for case type: Unknown"),
+    ])
+    def test_analyze_case_with_playbook_fallback(self, stub_services, cases, expected_reason):
+        """Test case analysis falls back when the case or its playbook is unavailable"""
+        stub_services(cases)
+        
+        result = PlaybooksService.analyze_case_with_playbook("case1")
         
-        assert result is not None
-        assert result["id"] == "pb1"
-        assert result["name"] == "Test Playbook"
+        assert result["case_id"] == "case1"
+        assert result["applied_playbook"] is None
+        assert result["fallback_reason"] == expected_reason
 
-    @patch("builtins.open", new_callable=mock_open, read_data='{"playbooks": [{"id": "pb1", "name": "Test Playbook"}]}')
-    @patch("pathlib.Path.exists", return_value=True)
-    def test_get_playbook_by_id_not_found(self, mock_exists, mock_file):
-        """Test getting playbook by ID when not found"""
-        result = PlaybooksService.get_playbook_by_id("nonexistent")
+    @pytest.mark.parametrize("total_weight, rules_count, total_rules, expected_strength, expected_confidence", [
+        (0.0, 0, 5, "Weak", 0.2),
+        (4.0, 4, 5, "Strong", 0.86),
+        (1.3, 2, 5, "Moderate", 0.58),
+        (1.0, 2, 5, "Weak", 0.32),
+        (0.9, 1, 5, "Weak", 0.26),
+    ])
+    def test_calculate_case_strength_and_confidence(self, total_weight, rules_count, total_rules,
+                                                    expected_strength, expected_confidence):
+        """Test case strength and confidence across weight and coverage bands"""
+        strength, confidence = PlaybooksService._calculate_case_strength_and_confidence(
+            total_weight, rules_count, total_rules
+        )
         
-        assert result is None
+        assert strength == expected_strength
+        assert confidence == expected_confidence
 
-    @patch("app.services.cases_service.CasesService.find_case_by_id")
-    def test_analyze_case_with_playbook_case_not_found(self, mock_find_case):
-        """Test case analysis when case not found"""
-        mock_find_case.return_value = None
+    @pytest.mark.parametrize("case_strength, applied_rules, expected_titles", [
+        ("Strong", [], ["Pursue Full Compensatory Damages", "Consider Injunctive Relief"]),
+        ("Moderate", ["termination_rule"], ["Negotiate Favorable Settlement", "Document Termination Circumstances"]),
+        ("Weak", ["breach_rule"], ["Explore Settlement Options", "Analyze Contract Terms and Performance"]),
+    ])
+    def test_generate_strategic_recommendations(self, case_strength, applied_rules, expected_titles):
+        """Test strategic recommendations for each case strength"""
+        recommendations = PlaybooksService._generate_strategic_recommendations(
+            {"case_strength": case_strength, "applied_rules": applied_rules}
+        )
         
-        result = PlaybooksService.analyze_case_with_playbook("nonexistent")
+        assert 0 < len(recommendations) <= 5
+        assert set(expected_titles) <= {rec["title"] for rec in recommendations}
+
+    def test_apply_playbook_rules_with_matching_rules(self):
+        """Test applying playbook rules when every rule matches the case"""
+        result = PlaybooksService._apply_playbook_rules(_MOCK_CASE, _MOCK_PLAYBOOK)
         
-        assert result["case_id"] == "nonexistent"
-        assert result["applied_playbook"] is None
-        assert "fallback_reason" in result
-        assert "Case not found" in result["fallback_reason"]
+        assert sorted(result["applied_rules"]) == ["rule1", "rule2"]
+        assert result["case_strength"] in {"Strong", "Moderate"}
+        assert result["confidence_level"] > 0.5
 
-    @patch("app.services.cases_service.CasesService.find_case_by_id")
-    def test_analyze_case_with_playbook_no_case_type(self, mock_find_case):
-        """Test case analysis when case has no case_type"""
-        mock_case = {"id": "case1", "summary": "Test case"}
-        mock_find_case.return_value = mock_case
+    @pytest.mark.parametrize("case_type, expected_titles", [
+        ("Employment Dispute", {"Employment Rights Act 1996 - Unfair Dismissal",
+                                "Equality Act 2010 - Discrimination Protection"}),
+        ("Contract Breach", {"Sale of Goods Act 1979 - Contract Performance",
+                             "Unfair Contract Terms Act 1977 - Term Validity"}),
+        ("Intellectual Property", {"Copyright, Designs and Patents Act 1988"}),
+        ("Unknown Type", set()),
+    ])
+    def test_get_relevant_precedents(self, case_type, expected_titles):
+        """Test precedents are selected by area of law"""
+        precedents = PlaybooksService._get_relevant_precedents(case_type)
         
-        result = PlaybooksService.analyze_case_with_playbook("case1")
+        assert {prec["title"] for prec in precedents} == expected_titles
+
+    @pytest.mark.parametrize("condition, summary, expected", _RULE_EVAL_CASES)
+    def test_rule_evaluation(self, condition, summary, expected):
+        """Test rule condition evaluation against case summaries"""
+        case = {"summary": summary, "case_type": "Test Case"}
         
-        assert "No case type specified" in result["fallback_reason"]
+        assert PlaybooksService._evaluate_rule_condition(case, {"condition": condition}) is expected
 
-    def test_generate_fallback_analysis(self):
+    def test_generate_fallback_analysis(self, monkeypatch):
         """Test fallback analysis generation"""
+        monkeypatch.setattr("app.services.playbooks_service.datetime", _FrozenDatetime)
         case_id = "test_case"
         reason = "Test reason"
         
@@ -102,4 +282,55 @@ class TestPlaybooksService:
         assert result["case_strength_assessment"]["overall_strength"] == "Unknown"
         assert result["case_strength_assessment"]["confidence_level"] == 0.1
         assert len(result["strategic_recommendations"]) > 0
-        assert "analysis_timestamp" in result
\ No newline at end of file
+        assert result["analysis_timestamp"] == "2024-01-01T09:30:00"
+
+@pytest.fixture(scope="module")
+def integration_result():
+    """Run the full case analysis once and share the result across tests"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(CasesService, "find_case_by_id", staticmethod({"integration_case": _INTEGRATION_CASE}.get))
+        mp.setattr(PlaybooksService, "match_playbook", staticmethod({"Employment Dispute": _INTEGRATION_PLAYBOOK}.get))
+        mp.setattr("app.services.playbooks_service.datetime", _FrozenDatetime)
+        return PlaybooksService.analyze_case_with_playbook("integration_case")
+
+
+class TestPlaybooksServiceIntegration:
+    """Integration tests for the full playbook analysis workflow"""
+
+    def test_integration_case_id(self, integration_result):
+        """Test the analysis is reported against the requested case"""
+        assert integration_result["case_id"] == "integration_case"
+
+    def test_integration_applied_playbook(self, integration_result):
+        """Test the matched playbook is reported"""
+        assert integration_result["applied_playbook"] == {
+            "id": "employment_playbook",
+            "name": "Employment Dispute Playbook",
+            "case_type": "Employment Dispute"
+        }
+
+    def test_integration_case_strength(self, integration_result):
+        """Test strengths, weaknesses and evidence reflect the applied rules"""
+        assessment = integration_result["case_strength_assessment"]
+        
+        assert assessment["overall_strength"] == "Strong"
+        assert assessment["confidence_level"] == 0.83
+        assert "Termination within protected period" in assessment["key_strengths"]
+        assert "Does not meet: Replaced by younger employee" in assessment["potential_weaknesses"]
+        assert "Safety reports" in assessment["supporting_evidence"]
+
+    def test_integration_recommendations(self, integration_result):
+        """Test strategic recommendations include high priority and rule-specific advice"""
+        recommendations = integration_result["strategic_recommendations"]
+        priorities = {rec["priority"] for rec in recommendations}
+        recommendation_ids = {rec["id"] for rec in recommendations}
+        
+        assert "High" in priorities
+        assert "document_termination_circumstances" in recommendation_ids
+
+    def test_integration_precedents(self, integration_result):
+        """Test employment precedents are attached"""
+        titles = {prec["title"] for prec in integration_result["relevant_precedents"]}
+        
+        assert "Employment Rights Act 1996 - Unfair Dismissal" in titles
+        assert integration_result["analysis_timestamp"] == "2024-01-01T09:30:00"